@@ -25,6 +25,8 @@ N_PROCESSES = [0, 2, 10]
 MAXSIZES_MP = [2, 8]
 N_ITEMS_MP = 500
 ROUNDS_MP = 10
+BATCH_SIZE_MP = 10
+ITEMS_MP = [(i, i) for i in range(N_ITEMS_MP)]
 
 
 _stop_object = -1
@@ -53,20 +55,25 @@ def _multi_thread(items, queue, n_threads):
 
 
 def _multi_process(items, queue, n_processes):
-    def put_func():
-        while True:
-            try:
-                item = items.pop(0)
-                queue.put(item)
-            except IndexError:
-                break
+    def put_func(chunk):
+        # Bulk puts save proxy round trips where the queue supports them
+        put_many = getattr(queue, "put_many", None)
+        for start in range(0, len(chunk), BATCH_SIZE_MP):
+            batch = chunk[start : start + BATCH_SIZE_MP]
+            if put_many is None:
+                for item in batch:
+                    queue.put(item)
+            else:
+                put_many(batch)
 
     def get_func():
         while queue.get()[1] is not _stop_object:
             continue
 
+    # Each put process gets every n-th item, so puts still interleave
     put_processes = [
-        mp.Process(target=put_func, daemon=True) for _ in range(n_processes)
+        mp.Process(target=put_func, args=(items[i::n_processes],), daemon=True)
+        for i in range(n_processes)
     ]
     get_processes = [
         mp.Process(target=get_func, daemon=True) for _ in range(n_processes)
@@ -97,10 +104,10 @@ def test_multi_thread(benchmark, q_type, n_threads, maxsize):
 @pytest.mark.parametrize("maxsize", MAXSIZES_MP)
 def test_multi_process(benchmark, q_type, n_processes, maxsize):
     def setup():
-        items = manager.list([(i, i) for i in range(N_ITEMS_MP)])
-        items.extend(
-            [(i, _stop_object) for i in range(N_ITEMS_MP, N_ITEMS_MP + n_processes)]
-        )
+        stop_items = [
+            (i, _stop_object) for i in range(N_ITEMS_MP, N_ITEMS_MP + n_processes)
+        ]
+        items = ITEMS_MP + stop_items
         queue = q_type(maxsize=maxsize)
         return (items, queue, n_processes), {}
 
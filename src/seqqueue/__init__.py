@@ -11,10 +11,12 @@ finally:
 
 from multiprocessing.managers import SyncManager
 
-from seqqueue.seqthreadqueue import SeqQueue
+from seqqueue.seqthreadqueue import SeqQueue, SeqQueueSPSC
 
 SyncManager.register("SeqQueue", SeqQueue)
+SyncManager.register("SeqQueueSPSC", SeqQueueSPSC)
 
 __all__ = [
     "SeqQueue",
+    "SeqQueueSPSC",
 ]
@@ -1,7 +1,9 @@
-from heapq import heappop, heappush, heapify
-from queue import Empty, Full, Queue, time
-from threading import Condition
-from typing import Sequence
+from _thread import LockType
+from collections import deque
+from queue import Empty, Full, Queue
+from threading import Event, Lock
+from time import monotonic
+from typing import Dict, Iterable, List, Optional, Sequence
 
 __author__ = "Adrian Krueger"
 __copyright__ = "Adrian Krueger"
@@ -21,7 +23,9 @@ class SeqQueue(Queue):
                 Defaults to 0.
         """
         self._index_shift = start_index
-        self._waiting_to_put = []
+        self._waiting_to_put: Dict[int, LockType] = {}
+        # Smallest index in _waiting_to_put, None if there are no waiters
+        self._min_waiting: Optional[int] = None
 
         super().__init__(maxsize)
 
@@ -34,41 +38,47 @@ class SeqQueue(Queue):
         the Full exception if no free slot was available within that time.
         Otherwise ('block' is false), put an item on the queue if a free slot
         is immediately available, else raise the Full exception ('timeout'
-        is ignored in that case).
+        is ignored in that case). Raises ValueError if the index was already
+        put on the queue.
         """
-        # Unlike in standard python queues, put threads hold individual put
-        # conditions for their slot. Note that once the slot becomes
-        # available, it remains empty until the put finishes, as no other put
-        # or get function can close the slot.
-        slot_empty = Condition(self.mutex)
-        with slot_empty:
-            index = item[0]
+        with self.mutex:
             if self.maxsize > 0:
-                if not block:
-                    if not self._slot_empty(index):
-                        raise Full
-                elif timeout is None:
-                    if not self._slot_empty(index):
-                        heappush(self._waiting_to_put, (index, slot_empty))
-                        slot_empty.wait()  # When notified, it is safe to resume
-                elif timeout < 0:
-                    raise ValueError("'timeout' must be a non-negative number")
-                else:
-                    if not self._slot_empty(index):
-                        heappush(self._waiting_to_put, (index, slot_empty))
-                        slot_empty.wait(timeout)
-                        if not self._slot_empty(index):
-                            # Remove the condition from the waiters
-                            cond_index = self._waiting_to_put.index((index, slot_empty))
-                            self._waiting_to_put.pop(cond_index)
-                            # Re-heapify waiter queue
-                            heapify(self._waiting_to_put)
-                            raise Full
+                self._wait_for_slot(item[0], block, timeout)
+            ready = self._ready
             self._put(item)
             self.unfinished_tasks += 1
             # A single put can make 0...maxsize slots available to get
-            if self._slot_ready():
-                self.not_empty.notify()  # Recursive get calls
+            self._notify_getters(self._ready - ready)
+
+    def put_many(self, items: Iterable[Sequence], block=True, timeout=None):
+        """Put multiple (index, item) pairs into the queue.
+
+        Items are put in the given order while acquiring the queue lock only
+        once. 'block' and 'timeout' apply to each item as in put(). If the
+        Full exception is raised, the items before the failing one remain on
+        the queue.
+        """
+        # Bind loop invariants to locals, saving attribute lookups per item
+        bounded = self.maxsize > 0
+        slot_empty = self._slot_empty
+        put = self._put
+        if bounded and block and timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        with self.mutex:
+            ready = self._ready
+            try:
+                for item in items:
+                    index = item[0]
+                    if bounded and not slot_empty(index):
+                        # Getters have to free the slot, wake them before waiting
+                        self._notify_getters(self._ready - ready)
+                        ready = self._ready
+                        self._wait_for_slot(index, block, timeout)
+                        ready = self._ready
+                    put(item)
+                    self.unfinished_tasks += 1
+            finally:
+                self._notify_getters(self._ready - ready)
 
     def get(self, block=True, timeout=None) -> Sequence:
         """Remove and return the next (index, item) pair from the queue.
@@ -82,51 +92,268 @@ class SeqQueue(Queue):
         in that case).
         """
         with self.not_empty:
-            if not block:
-                if not self._slot_ready():
-                    raise Empty
-            elif timeout is None:
-                while not self._slot_ready():
-                    self.not_empty.wait()
-            elif timeout < 0:
-                raise ValueError("'timeout' must be a non-negative number")
-            else:
-                endtime = time() + timeout
-                while not self._slot_ready():
-                    remaining = endtime - time()
-                    if remaining <= 0.0:
-                        raise Empty
-                    self.not_empty.wait(remaining)
+            self._wait_for_item(block, timeout)
             item = self._get()
 
             # A single get can make 0 or 1 slot available to put
-            if len(self._waiting_to_put) and self._slot_empty(
-                self._waiting_to_put[0][0]
-            ):
-                heappop(self._waiting_to_put)[1].notify()
-            elif self._slot_ready():
-                # Another slot might be available from the last put call
-                self.not_empty.notify()
+            if self._waiting_to_put and self._slot_empty(self._min_waiting):
+                self._pop_put_waiter(self._min_waiting).release()
             return item
 
+    def get_many(self, n: int, block=True, timeout=None) -> List[Sequence]:
+        """Remove and return up to n next (index, item) pairs from the queue.
+
+        Blocks as get() until the next item is available, then returns it
+        together with the following items that are already on the queue,
+        while acquiring the queue lock only once.
+        """
+        if n < 1:
+            raise ValueError("'n' must be a positive number")
+        with self.not_empty:
+            self._wait_for_item(block, timeout)
+            get = self._get
+            items = [get() for _ in range(min(n, self._ready))]
+
+            # Each get can make 1 slot available to put
+            while self._waiting_to_put and self._slot_empty(self._min_waiting):
+                self._pop_put_waiter(self._min_waiting).release()
+            return items
+
     def _init(self, maxsize: int) -> None:
-        self.queue = []
+        # Items are stored at the position of their index. For bounded queues
+        # the indices on the queue span less than maxsize, so a ring buffer
+        # never has two items on the same slot.
+        self.queue = [None] * maxsize if maxsize > 0 else {}
+        self._count = 0
+        # Number of consecutive items from _index_shift on. The next item can
+        # be retrieved from queue, if it is not 0
+        self._ready = 0
+        self._waiting_getters = 0
+
+    def _wait_for_item(self, block: bool, timeout) -> None:
+        """Wait until the next item can be retrieved from queue, see get().
+
+        Must be called with self.mutex held.
+        """
+        if not block:
+            if not self._ready:
+                raise Empty
+        elif timeout is None:
+            while not self._ready:
+                self._wait_to_get()
+        elif timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        else:
+            endtime = monotonic() + timeout
+            while not self._ready:
+                remaining = endtime - monotonic()
+                if remaining <= 0.0:
+                    raise Empty
+                self._wait_to_get(remaining)
+
+    def _wait_for_slot(self, index: int, block: bool, timeout) -> None:
+        """Wait until item with index can be put on queue, see put().
+
+        Must be called with self.mutex held and only for bounded queues.
+        """
+        # Unlike in standard python queues, put threads hold individual
+        # waiters for their slot. Note that once the slot becomes available,
+        # it remains empty until the put finishes, as no other put or get
+        # function can close the slot. The waiter is only created if the put
+        # call actually has to wait.
+        if not block:
+            if not self._slot_empty(index):
+                raise Full
+        elif timeout is None:
+            if not self._slot_empty(index):
+                self._wait_to_put(index)  # When released, it is safe to resume
+        elif timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        else:
+            if not self._slot_empty(index):
+                self._wait_to_put(index, timeout)
+                if not self._slot_empty(index):
+                    raise Full
+
+    def _wait_to_put(self, index: int, timeout=None) -> None:
+        """Wait until a get call releases the slot for index or timeout."""
+        # The waiter is a bare lock acquired by its owner. Only the put call
+        # waits on it, so there is no need for the waiter list and lock
+        # ownership checks of a Condition
+        if index in self._waiting_to_put:
+            raise ValueError(f"Index {index} was already put on the queue")
+        slot_empty = Lock()
+        slot_empty.acquire()
+        self._waiting_to_put[index] = slot_empty
+        if self._min_waiting is None or index < self._min_waiting:
+            self._min_waiting = index
+        self.mutex.release()
+        try:
+            slot_empty.acquire(True, -1 if timeout is None else timeout)
+        finally:
+            self.mutex.acquire()
+            # On timeout, the waiter might not have been released yet
+            if self._waiting_to_put.get(index) is slot_empty:
+                self._pop_put_waiter(index)
+
+    def _pop_put_waiter(self, index: int) -> LockType:
+        """Unregister and return the waiter lock of a blocked put call."""
+        slot_empty = self._waiting_to_put.pop(index)
+        if index == self._min_waiting:
+            # There are at most as many waiters as put threads to scan
+            self._min_waiting = min(self._waiting_to_put, default=None)
+        return slot_empty
+
+    def _wait_to_get(self, timeout=None) -> None:
+        """Wait on not_empty, counted as waiting get call."""
+        # self.mutex is the plain, non-reentrant Lock of Queue. All get calls
+        # wait for the same index, so they share a Condition on it instead of
+        # bare waiter locks as put calls do
+        self._waiting_getters += 1
+        try:
+            self.not_empty.wait(timeout)
+        finally:
+            self._waiting_getters -= 1
+
+    def _notify_getters(self, n_ready: int) -> None:
+        """Wake one waiting get call for each of n_ready new items."""
+        # Items that were ready before have already woken their getters, so
+        # waking more than the new items only makes get calls wait again
+        if n_ready > 0 and self._waiting_getters:
+            self.not_empty.notify(min(n_ready, self._waiting_getters))
 
     def _slot_empty(self, index: int) -> bool:
         """Return True, if item with index can be put on queue."""
         return (index - self._index_shift) < self.maxsize
 
-    def _slot_ready(self) -> bool:
-        """Return True, if next item can be retrieved from queue."""
-        return self._qsize() and self.queue[0][0] - self._index_shift == 0
+    def _slot_filled(self, index: int) -> bool:
+        """Return True, if item with index is on the queue."""
+        if self.maxsize > 0:
+            return self.queue[index % self.maxsize] is not None
+        return index in self.queue
 
     def _get(self) -> Sequence:
-        item = heappop(self.queue)
+        if self.maxsize > 0:
+            pos = self._index_shift % self.maxsize
+            item = self.queue[pos]
+            self.queue[pos] = None
+        else:
+            item = self.queue.pop(self._index_shift)
         self._index_shift += 1
+        self._count -= 1
+        self._ready -= 1
         return item
 
     def _put(self, item: Sequence):
-        heappush(self.queue, item)
+        index = item[0]
+        # A stale or duplicate index would overwrite a slot of the queue
+        if index < self._index_shift or self._slot_filled(index):
+            raise ValueError(f"Index {index} was already put on the queue")
+        if self.maxsize > 0:
+            self.queue[index % self.maxsize] = item
+        else:
+            self.queue[index] = item
+        self._count += 1
+        if index == self._index_shift + self._ready:
+            # The item closes the gap after the ready items
+            end = self._index_shift + self._count
+            slot_filled = self._slot_filled
+            index += 1
+            while index < end and slot_filled(index):
+                index += 1
+            self._ready = index - self._index_shift
+
+    def _qsize(self) -> int:
+        return self._count
+
+
+class SeqQueueSPSC(SeqQueue):
+    """SeqQueue for a single put thread that puts items in incremental order."""
+
+    def __init__(self, maxsize: int = 0, start_index: int = 0) -> None:
+        """Create an unbounded queue for one put and one get thread.
+
+        Items have to be put in incremental index order, so they can be
+        appended to a deque without reordering. Appending to and popping
+        from a deque are atomic, so get doesn't acquire the queue lock and
+        put only acquires it to count unfinished tasks.
+
+        Args:
+            maxsize (int, optional): Only accepted for compatibility with
+                SeqQueue. Raises ValueError if maxsize > 0. Defaults to 0.
+            start_index (int, optional): The index of the first object on the queue.
+                Defaults to 0.
+        """
+        if maxsize > 0:
+            raise ValueError("SeqQueueSPSC is unbounded, 'maxsize' must be <= 0")
+        self._next_index = start_index
+        self._item_added = Event()
+
+        super().__init__(maxsize=0, start_index=start_index)
+
+    def put(self, item: Sequence, block=True, timeout=None):
+        """Put the next (index, item) pair into the queue.
+
+        The queue is unbounded, so put never blocks ('block' and 'timeout'
+        are ignored). Raises ValueError if the index of the item is not the
+        next index.
+        """
+        if item[0] != self._next_index:
+            raise ValueError(f"Expected index {self._next_index}, got {item[0]}")
+        self._next_index += 1
+        with self.mutex:
+            self.unfinished_tasks += 1
+        self.queue.append(item)
+        self._item_added.set()
+
+    def put_many(self, items: Iterable[Sequence], block=True, timeout=None):
+        """Put multiple (index, item) pairs into the queue, see put()."""
+        for item in items:
+            self.put(item)
+
+    def get(self, block=True, timeout=None) -> Sequence:
+        """Remove and return the next (index, item) pair from the queue.
+
+        Blocks as in SeqQueue.get(). Must only be called from a single thread.
+        """
+        if block and timeout is not None:
+            if timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            endtime = monotonic() + timeout
+        while True:
+            try:
+                return self.queue.popleft()
+            except IndexError:
+                if not block:
+                    raise Empty
+            # The event is only cleared right before the next popleft, so an
+            # item appended after the failed popleft always sets it
+            if timeout is None:
+                self._item_added.wait()
+            else:
+                remaining = endtime - monotonic()
+                if remaining <= 0.0 or not self._item_added.wait(remaining):
+                    raise Empty
+            self._item_added.clear()
+
+    def get_many(self, n: int, block=True, timeout=None) -> List[Sequence]:
+        """Remove and return up to n next (index, item) pairs from the queue.
+
+        Blocks as get() until the next item is available, then returns it
+        together with the following items that are already on the queue.
+        """
+        if n < 1:
+            raise ValueError("'n' must be a positive number")
+        items = [self.get(block, timeout)]
+        while len(items) < n:
+            try:
+                items.append(self.queue.popleft())
+            except IndexError:
+                break
+        return items
+
+    def _init(self, maxsize: int) -> None:
+        self.queue = deque()
 
     def _qsize(self) -> int:
         return len(self.queue)
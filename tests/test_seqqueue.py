@@ -1,4 +1,5 @@
 import multiprocessing
+import sys
 from queue import Empty, Full
 from threading import Thread
 from time import sleep
@@ -6,13 +7,15 @@ from timeit import default_timer
 
 import pytest
 
-from seqqueue import SeqQueue
+from seqqueue import SeqQueue, SeqQueueSPSC
 
 __author__ = "Adrian Krueger"
 __copyright__ = "Adrian Krueger"
 __license__ = "MIT"
 
-Q_TYPES = [SeqQueue, multiprocessing.Manager().SeqQueue]
+manager = multiprocessing.Manager()
+Q_TYPES = [SeqQueue, manager.SeqQueue]
+SPSC_Q_TYPES = [SeqQueueSPSC, manager.SeqQueueSPSC]
 MAXSIZES = [0, 2, 10]
 N_ITEMS = 1000
 N_INTERMEDIATE_QUEUES = 10
@@ -85,6 +88,112 @@ def test_timeout_put_twice(q_type):
     assert q.get() == (1, "1")
 
 
+@pytest.mark.parametrize("q_type", Q_TYPES)
+@pytest.mark.parametrize("maxsize", [0, 2])
+def test_index_put_twice(q_type, maxsize):
+    q = q_type(maxsize=maxsize)
+    q.put((0, "0"))
+    q.get()
+    with pytest.raises(ValueError):
+        q.put((0, "dup"))
+    q.put((1, "1"))
+    with pytest.raises(ValueError):
+        q.put_many([(1, "dup")])
+    assert q.qsize() == 1
+    assert q.get() == (1, "1")
+    assert q.empty()
+
+    if maxsize > 0:
+        # A second put call of a blocked index must not replace its waiter
+        q = q_type(maxsize=1)
+        q.put((0, "0"))
+        put_1 = Thread(target=lambda: q.put((1, "1")), daemon=True)
+        put_1.start()
+        sleep(0.1)
+        with pytest.raises(ValueError):
+            q.put((1, "dup"))
+        with pytest.raises(ValueError):
+            q.put((1, "dup"), timeout=0.1)
+        assert q.get() == (0, "0")
+        put_1.join(1)
+        assert not put_1.is_alive()
+        assert q.get(timeout=1) == (1, "1")
+
+
+@pytest.mark.parametrize("q_type", Q_TYPES)
+def test_large_index(q_type):
+    start_index = sys.maxsize + 1
+    q = q_type(maxsize=1, start_index=start_index)
+    q.put((start_index, "a"))
+    put_next = Thread(target=lambda: q.put((start_index + 1, "b")), daemon=True)
+    put_next.start()
+    sleep(0.1)
+    assert q.get(timeout=1) == (start_index, "a")
+    put_next.join(1)
+    assert not put_next.is_alive()
+    assert q.get(timeout=1) == (start_index + 1, "b")
+
+
+@pytest.mark.parametrize("q_type", Q_TYPES)
+def test_put_many(q_type):
+    q = q_type(maxsize=2)
+    items = [(i, str(i)) for i in range(5)]
+    got = []
+    getter = Thread(target=lambda: got.extend(q.get() for _ in items), daemon=True)
+    getter.start()
+    q.put_many([items[1], items[0]] + items[2:])
+    getter.join(2)
+    assert not getter.is_alive()
+    assert got == items
+
+    with pytest.raises(Full):
+        q.put_many([(6, "6"), (5, "5"), (7, "7")], block=False)
+    with pytest.raises(ValueError):
+        q.put_many([(7, "7")], timeout=-1)
+    assert q.qsize() == 2
+    assert q.get() == (5, "5")
+
+
+@pytest.mark.parametrize("q_type", Q_TYPES)
+def test_get_many(q_type):
+    q = q_type(maxsize=3)
+    q.put((1, "1"))
+    q.put((2, "2"))
+    with pytest.raises(Empty):
+        q.get_many(3, timeout=0.1)
+    put_3 = Thread(target=lambda: q.put((3, "3")), daemon=True)
+    put_3.start()
+    q.put((0, "0"))
+    assert q.get_many(2) == [(0, "0"), (1, "1")]
+    put_3.join(1)
+    assert not put_3.is_alive()
+    assert q.get_many(5, block=False) == [(2, "2"), (3, "3")]
+
+
+@pytest.mark.parametrize("q_type", SPSC_Q_TYPES)
+def test_spsc(q_type):
+    with pytest.raises(ValueError):
+        SeqQueueSPSC(10)  # Unbounded, maxsize > 0 is rejected
+    q = q_type(start_index=1)
+    items = [(i, str(i)) for i in range(1, N_ITEMS + 1)]
+    got = []
+    getter = Thread(target=lambda: got.extend(q.get() for _ in items), daemon=True)
+    getter.start()
+    for item in items:
+        q.put(item)
+    getter.join(MAX_WAIT_TIME_SECONDS)
+    assert not getter.is_alive()
+    assert got == items
+
+    with pytest.raises(ValueError):
+        q.put((N_ITEMS + 2, "x"))
+    with pytest.raises(Empty):
+        q.get(timeout=0.1)
+    q.put_many([(N_ITEMS + 1, "x"), (N_ITEMS + 2, "y")])
+    assert q.qsize() == 2
+    assert q.get_many(3, block=False) == [(N_ITEMS + 1, "x"), (N_ITEMS + 2, "y")]
+
+
 @pytest.mark.parametrize("q_type", Q_TYPES)
 @pytest.mark.parametrize("maxsize", MAXSIZES)
 def test_random_maxsize(q_type, maxsize):